@@ -34,7 +34,7 @@ def wrap_app_handling_exceptions(app: ASGIApp, conn: Request | WebSocket) -> ASG
         async def sender(message: Message) -> None:
             nonlocal response_started
 
-            if message["type"] == "http.response.start":
+            if not response_started and message["type"] == "http.response.start":
                 response_started = True
             await send(message)
 
@@ -4,7 +4,7 @@ import functools
 import inspect
 import sys
 import typing
-from contextlib import contextmanager
+from types import TracebackType
 
 from starlette.types import Scope
 
@@ -70,16 +70,41 @@ class AwaitableOrContextManagerWrapper(typing.Generic[SupportsAsyncCloseType]):
         return None
 
 
-@contextmanager
-def collapse_excgroups() -> typing.Generator[None, None, None]:
-    try:
-        yield
-    except BaseException as exc:
+class _CollapseExcGroups:
+    """
+    Stateless context manager, so a single instance can be shared by every
+    request rather than building a generator-based context manager each time.
+    """
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if exc is None:
+            return None
+
+        collapsed = exc
         if has_exceptiongroups:  # pragma: no cover
-            while isinstance(exc, BaseExceptionGroup) and len(exc.exceptions) == 1:
-                exc = exc.exceptions[0]
+            while isinstance(collapsed, BaseExceptionGroup) and len(collapsed.exceptions) == 1:
+                collapsed = collapsed.exceptions[0]
+
+        if collapsed is not exc:
+            raise collapsed
+        return None
+
+
+_collapse_excgroups = _CollapseExcGroups()
+
 
-        raise exc
+def collapse_excgroups() -> typing.ContextManager[None]:
+    return _collapse_excgroups
 
 
 def get_route_path(scope: Scope) -> str:
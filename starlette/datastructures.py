@@ -628,8 +628,29 @@ class MutableHeaders(Headers):
         return value
 
     def update(self, other: typing.Mapping[str, str]) -> None:
-        for key, val in other.items():
-            self[key] = val
+        """
+        Set each header in `other`, with the same result as calling
+        `self[key] = value` for every item.
+        """
+        if len(other) <= 2:
+            # For a couple of items, one scan per item is cheaper than rebuilding the list.
+            for key, val in other.items():
+                self[key] = val
+            return
+
+        update_items = {key.lower().encode("latin-1"): value.encode("latin-1") for key, value in other.items()}
+        found_keys: set[bytes] = set()
+        new_list: list[tuple[bytes, bytes]] = []
+        for item_key, item_value in self._list:
+            if item_key not in update_items:
+                new_list.append((item_key, item_value))
+            elif item_key not in found_keys:
+                # The first occurrence keeps its position, any duplicates are dropped.
+                found_keys.add(item_key)
+                new_list.append((item_key, update_items[item_key]))
+        new_list.extend(item for item in update_items.items() if item[0] not in found_keys)
+        # Mutate in place, since the list may be shared with a response or an ASGI message.
+        self._list[:] = new_list
 
     def append(self, key: str, value: str) -> None:
         """
@@ -164,9 +164,12 @@ class BaseHTTPMiddleware:
                     if not message.get("more_body", False):
                         break
 
-            response = _StreamingResponse(status_code=message["status"], content=body_stream(), info=info)
-            response.raw_headers = message["headers"]
-            return response
+            return _StreamingResponse(
+                status_code=message["status"],
+                content=body_stream(),
+                raw_headers=message["headers"],
+                info=info,
+            )
 
         streams: anyio.create_memory_object_stream[Message] = anyio.create_memory_object_stream()
         send_stream, recv_stream = streams
@@ -188,16 +191,14 @@ class _StreamingResponse(Response):
     def __init__(
         self,
         content: AsyncContentStream,
-        status_code: int = 200,
-        headers: typing.Mapping[str, str] | None = None,
-        media_type: str | None = None,
+        status_code: int,
+        raw_headers: list[tuple[bytes, bytes]],
         info: typing.Mapping[str, typing.Any] | None = None,
     ) -> None:
         self.info = info
         self.body_iterator = content
         self.status_code = status_code
-        self.media_type = media_type
-        self.init_headers(headers)
+        self.raw_headers = raw_headers
         self.background = None
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
@@ -157,7 +157,7 @@ class ServerErrorMiddleware:
         async def _send(message: Message) -> None:
             nonlocal response_started, send
 
-            if message["type"] == "http.response.start":
+            if not response_started and message["type"] == "http.response.start":
                 response_started = True
             await send(message)
 
@@ -54,6 +54,12 @@ class SessionMiddleware:
         else:
             scope["session"] = {}
 
+        if scope["type"] == "websocket":
+            # Session cookies are only ever written on HTTP responses,
+            # so there is nothing to intercept on the way out.
+            await self.app(scope, receive, send)
+            return
+
         async def send_wrapper(message: Message) -> None:
             if message["type"] == "http.response.start":
                 if scope["session"]:
@@ -10,7 +10,7 @@ import typing
 import warnings
 from datetime import datetime
 from email.utils import format_datetime, formatdate
-from functools import partial
+from functools import lru_cache, partial
 from mimetypes import guess_type
 from secrets import token_hex
 from urllib.parse import quote
@@ -26,6 +26,14 @@ from starlette.requests import ClientDisconnect
 from starlette.types import Receive, Scope, Send
 
 
+@lru_cache(maxsize=128)
+def _content_type_header(media_type: str, charset: str) -> bytes:
+    # Responses are built from a small set of media types, so cache the encoded header value.
+    if media_type.startswith("text/") and "charset=" not in media_type.lower():
+        media_type += "; charset=" + charset
+    return media_type.encode("latin-1")
+
+
 class Response:
     media_type = None
     charset = "utf-8"
@@ -74,9 +82,7 @@ class Response:
 
         content_type = self.media_type
         if content_type is not None and populate_content_type:
-            if content_type.startswith("text/") and "charset=" not in content_type.lower():
-                content_type += "; charset=" + self.charset
-            raw_headers.append((b"content-type", content_type.encode("latin-1")))
+            raw_headers.append((b"content-type", _content_type_header(content_type, self.charset)))
 
         self.raw_headers = raw_headers
 
@@ -5,8 +5,9 @@ from starlette.middleware import Middleware
 from starlette.middleware.sessions import SessionMiddleware
 from starlette.requests import Request
 from starlette.responses import JSONResponse
-from starlette.routing import Mount, Route
+from starlette.routing import Mount, Route, WebSocketRoute
 from starlette.testclient import TestClient
+from starlette.websockets import WebSocket
 from tests.types import TestClientFactory
 
 
@@ -198,3 +199,28 @@ def test_domain_cookie(test_client_factory: TestClientFactory) -> None:
     client.cookies.delete("session")
     response = client.get("/view_session")
     assert response.json() == {"session": {}}
+
+
+async def websocket_session(websocket: WebSocket) -> None:
+    await websocket.accept()
+    await websocket.send_json({"session": websocket.session})
+    await websocket.close()
+
+
+def test_session_websocket(test_client_factory: TestClientFactory) -> None:
+    app = Starlette(
+        routes=[
+            Route("/update_session", endpoint=update_session, methods=["POST"]),
+            WebSocketRoute("/ws", endpoint=websocket_session),
+        ],
+        middleware=[Middleware(SessionMiddleware, secret_key="example")],
+    )
+    client = test_client_factory(app)
+
+    with client.websocket_connect("/ws") as websocket:
+        assert websocket.receive_json() == {"session": {}}
+
+    client.post("/update_session", json={"some": "data"})
+
+    with client.websocket_connect("/ws") as websocket:
+        assert websocket.receive_json() == {"session": {"some": "data"}}
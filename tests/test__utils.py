@@ -3,7 +3,7 @@ from typing import Any
 
 import pytest
 
-from starlette._utils import get_route_path, is_async_callable
+from starlette._utils import collapse_excgroups, get_route_path, is_async_callable
 from starlette.types import Scope
 
 
@@ -94,3 +94,11 @@ def test_async_nested_partial() -> None:
 )
 def test_get_route_path(scope: Scope, expected_result: str) -> None:
     assert get_route_path(scope) == expected_result
+
+
+def test_collapse_excgroups_reraises_plain_exception() -> None:
+    exc = RuntimeError("boom")
+    with pytest.raises(RuntimeError) as info:
+        with collapse_excgroups():
+            raise exc
+    assert info.value is exc
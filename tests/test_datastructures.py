@@ -238,6 +238,29 @@ def test_mutable_headers_update_dict() -> None:
     assert h.raw == [(b"a", b"1")]
 
 
+def test_mutable_headers_update_matches_setitem() -> None:
+    raw = [(b"a", b"1"), (b"b", b"2"), (b"a", b"3"), (b"c", b"4")]
+    other = {"A": "x", "d": "y", "c": "z", "D": "w"}
+
+    h = MutableHeaders(raw=raw[:])
+    h.update(other)
+
+    expected = MutableHeaders(raw=raw[:])
+    for key, value in other.items():
+        expected[key] = value
+
+    assert h.raw == expected.raw == [(b"a", b"x"), (b"b", b"2"), (b"c", b"z"), (b"d", b"w")]
+
+
+def test_mutable_headers_update_in_place() -> None:
+    raw = [(b"a", b"1")]
+    h = MutableHeaders(raw=raw)
+    h.update({"b": "2"})
+    h.update({"a": "3", "c": "4", "d": "5"})
+    h.update({})
+    assert raw == [(b"a", b"3"), (b"b", b"2"), (b"c", b"4"), (b"d", b"5")]
+
+
 def test_mutable_headers_merge_not_mapping() -> None:
     h = MutableHeaders()
     with pytest.raises(TypeError):